@@ -0,0 +1,60 @@
+# Generated by Django 4.1.7 on 2026-10-15 22:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("trak", "0005_alter_address_city_alter_contact_email"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="contact",
+            name="phone",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                to="trak.epaphone",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="handler",
+            name="contact",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                to="trak.contact",
+                verbose_name="Contact Information",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="handler",
+            name="emergency_phone",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                to="trak.epaphone",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="handler",
+            name="mail_address",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="mail_address",
+                to="trak.address",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="handler",
+            name="site_address",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="site_address",
+                to="trak.address",
+            ),
+        ),
+    ]
@@ -86,7 +86,7 @@ class Contact(TrakBaseModel):
     )
     phone = models.ForeignKey(
         EpaPhone,
-        on_delete=models.CASCADE,
+        on_delete=models.PROTECT,
         null=True,
         blank=True,
     )
@@ -1,8 +1,9 @@
 import logging
-from typing import Union
+from typing import Dict, List, Optional
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Exists, OuterRef, Prefetch
 
 from .address_model import Address
 from .base_model import TrakBaseManager, TrakBaseModel
@@ -12,15 +13,55 @@ from .signature_model import ESignature, PaperSignature
 logger = logging.getLogger(__name__)
 
 
+def _pop_phone(data: Dict, key: str) -> Optional[EpaPhone]:
+    """Remove phone data from the dict and return an (unsaved) EpaPhone, if present"""
+    phone = data.pop(key, None)
+    if phone is None or isinstance(phone, EpaPhone):
+        return phone
+    return EpaPhone(**phone)
+
+
+def _pop_emergency_phone(data: Dict) -> Optional[EpaPhone]:
+    """Remove emergency phone data from the dict and return an (unsaved) EpaPhone, if present"""
+    return _pop_phone(data, "emergency_phone")
+
+
+def _pop_address(data: Dict, key: str) -> Address:
+    """Remove address data from the dict and return an (unsaved) Address"""
+    try:
+        address = data.pop(key)
+    except KeyError as exc:
+        logger.warning(exc)
+        raise ValidationError(exc)
+    if isinstance(address, Address):
+        return address
+    return Address(**address)
+
+
+def _pooled(instance: models.Model, pool: Dict, *key) -> models.Model:
+    """
+    Return the instance from the pool with the same column values, adding it if none.
+    Saved instances are returned as is.
+    """
+    if instance.pk is not None:
+        return instance
+    key = (
+        *(
+            getattr(instance, field.attname)
+            for field in instance._meta.concrete_fields
+            if not field.primary_key
+        ),
+        *key,
+    )
+    return pool.setdefault(key, instance)
+
+
 class HandlerManager(TrakBaseManager):
     """
     Inter-model related functionality for Handler Model
     """
 
-    def __init__(self):
-        self.handler_data = None
-        super().__init__()
-
+    @transaction.atomic
     def save(self, **handler_data):
         """
         Create a handler and its related fields
@@ -33,43 +74,148 @@ class HandlerManager(TrakBaseManager):
         """
         try:
             epa_id = handler_data.get("epa_id")
-            if self.model.objects.filter(epa_id=epa_id).exists():
-                return Handler.objects.get(epa_id=epa_id)
-            self.handler_data = handler_data
-            new_contact = Contact.objects.save(**self.handler_data.pop("contact"))
-            emergency_phone = self.get_emergency_phone()
-            site_address = self.get_address("site_address")
-            mail_address = self.get_address("mail_address")
-            return super().save(
-                site_address=site_address,
-                mail_address=mail_address,
-                emergency_phone=emergency_phone,
-                contact=new_contact,
-                **self.handler_data,
-            )
+            existing = self.filter(epa_id=epa_id).first()
+            if existing:
+                return existing
+            # related models are only built on a miss, _bulk_save upserts on epa_id
+            return self._bulk_save([self._prepare(handler_data)])[0]
         except KeyError as exc:
-            logger.warning(f"error while creating handler {exc}")
+            logger.warning("error while creating handler %s", exc)
 
-    def get_emergency_phone(self) -> Union[EpaPhone, None]:
-        """Check if emergency phone is present and create an EpaPhone row"""
-        try:
-            emergency_phone_data = self.handler_data.pop("emergency_phone")
-            if emergency_phone_data is not None:
-                return EpaPhone.objects.create(**emergency_phone_data)
-        except KeyError as exc:
-            logger.debug(exc)
-            return None
+    def get_cached(self, epa_id: str, cache: Dict[str, "Handler"]) -> Optional["Handler"]:
+        """
+        Return a handler from the cache, or the database, and add it to the cache if found.
 
-    def get_address(self, key) -> Address:
-        """Remove Address data and create if necessary"""
-        try:
-            address = self.handler_data.pop(key)
-            if isinstance(address, Address):
-                return address
-            return Address.objects.create(**address)
-        except KeyError as exc:
-            logger.warning(exc)
-            raise ValidationError(exc)
+        Args:
+            epa_id (str): the handler's EPA ID
+            cache (Dict): Handler instances by EPA ID, scoped to the caller (e.g., a service call)
+        """
+        handler = cache.get(epa_id)
+        if handler is None:
+            handler = self.filter(epa_id=epa_id).first()
+            if handler is not None:
+                cache[epa_id] = handler
+        return handler
+
+    @transaction.atomic
+    def get_or_create_bulk(self, handlers: List[Dict]) -> Dict[str, "Handler"]:
+        """
+        Retrieve the handlers in a batch with one query, and create those that do not
+        exist with one INSERT per table.
+
+        Args:
+            handlers (List[Dict]): handler data dicts, the dicts are not modified.
+
+        Returns:
+            Dict mapping each handler's EPA ID to its Handler instance
+        """
+        epa_ids = {handler_data["epa_id"] for handler_data in handlers}
+        # full rows, the handlers can end up serialized (e.g., ManifestView.create)
+        existing = self.in_bulk(epa_ids, field_name="epa_id")
+        new_handlers = {}
+        for handler_data in handlers:
+            epa_id = handler_data["epa_id"]
+            if epa_id not in existing and epa_id not in new_handlers:
+                new_handlers[epa_id] = self._prepare(handler_data)
+        if new_handlers:
+            self._bulk_save(list(new_handlers.values()))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Handlers created %s", list(new_handlers))
+        return {**existing, **new_handlers}
+
+    def _prepare(self, handler_data: Dict) -> "Handler":
+        """Return an unsaved Handler with its unsaved related models attached"""
+        data = dict(handler_data)
+        contact_data = dict(data.pop("contact"))
+        return self.model(
+            contact=Contact(phone=_pop_phone(contact_data, "phone"), **contact_data),
+            emergency_phone=_pop_emergency_phone(data),
+            site_address=_pop_address(data, "site_address"),
+            mail_address=_pop_address(data, "mail_address"),
+            **data,
+        )
+
+    def _bulk_save(self, handlers: List["Handler"]) -> List["Handler"]:
+        """
+        Insert unsaved handlers and related models, parents first, one INSERT per table.
+        Identical addresses, phones, and contacts in the batch are saved once and shared.
+        """
+        address_pool, phone_pool, contact_pool = {}, {}, {}
+        for handler in handlers:
+            handler.site_address = _pooled(handler.site_address, address_pool)
+            handler.mail_address = _pooled(handler.mail_address, address_pool)
+            if handler.emergency_phone is not None:
+                handler.emergency_phone = _pooled(handler.emergency_phone, phone_pool)
+            contact = handler.contact
+            if contact.phone is not None:
+                contact.phone = _pooled(contact.phone, phone_pool)
+            handler.contact = _pooled(contact, contact_pool, id(contact.phone))
+        addresses = list(address_pool.values())
+        phones = list(phone_pool.values())
+        contacts = list(contact_pool.values())
+        Address.objects.bulk_create(addresses)
+        EpaPhone.objects.bulk_create(phones)
+        Contact.objects.bulk_create(contacts)
+        # INSERT ... ON CONFLICT, a handler saved concurrently since our lookup is updated
+        self.bulk_create(
+            handlers,
+            update_conflicts=True,
+            unique_fields=["epa_id"],
+            update_fields=["name", "site_type", "modified", "registered"],
+        )
+        # Django (<5.0) doesn't set primary keys on upserted objects, retrieve them by EPA ID.
+        # On conflict, the stored row keeps its related rows, so we retrieve those too.
+        stored = {
+            epa_id: related_ids
+            for epa_id, *related_ids in self.filter(
+                epa_id__in=[handler.epa_id for handler in handlers]
+            ).values_list(
+                "epa_id",
+                "id",
+                "site_address_id",
+                "mail_address_id",
+                "contact_id",
+                "emergency_phone_id",
+            )
+        }
+        for handler in handlers:
+            (
+                handler.pk,
+                handler.site_address_id,
+                handler.mail_address_id,
+                handler.contact_id,
+                handler.emergency_phone_id,
+            ) = stored[handler.epa_id]
+        self._delete_unreferenced(handlers, addresses, phones, contacts)
+        return handlers
+
+    @staticmethod
+    def _delete_unreferenced(
+        handlers: List["Handler"],
+        addresses: List[Address],
+        phones: List[EpaPhone],
+        contacts: List[Contact],
+    ) -> None:
+        """
+        Delete the related rows inserted by _bulk_save that no handler references,
+        left over when a handler's upsert conflicted with a row saved concurrently.
+        """
+        contact_ids = {handler.contact_id for handler in handlers}
+        address_ids = {handler.site_address_id for handler in handlers} | {
+            handler.mail_address_id for handler in handlers
+        }
+        phone_ids = {handler.emergency_phone_id for handler in handlers} | {
+            contact.phone_id for contact in contacts if contact.pk in contact_ids
+        }
+        unreferenced = [
+            (Contact, {contact.pk for contact in contacts} - contact_ids),
+            (EpaPhone, {phone.pk for phone in phones} - phone_ids),
+            (Address, {address.pk for address in addresses} - address_ids),
+        ]
+        for model, pks in unreferenced:
+            if pks:
+                model.objects.filter(pk__in=pks).delete()
+                logger.debug("deleted unreferenced %s %s", model.__name__, pks)
 
 
 class Handler(TrakBaseModel):
@@ -98,14 +244,16 @@ class Handler(TrakBaseModel):
     name = models.CharField(
         max_length=200,
     )
+    # addresses, contacts, and phones can be shared by handlers (see HandlerManager._bulk_save),
+    # deleting one must not cascade to every handler that references it
     site_address = models.ForeignKey(
         "Address",
-        on_delete=models.CASCADE,
+        on_delete=models.PROTECT,
         related_name="site_address",
     )
     mail_address = models.ForeignKey(
         "Address",
-        on_delete=models.CASCADE,
+        on_delete=models.PROTECT,
         related_name="mail_address",
     )
     modified = models.BooleanField(
@@ -118,12 +266,12 @@ class Handler(TrakBaseModel):
     )
     contact = models.ForeignKey(
         "Contact",
-        on_delete=models.CASCADE,
+        on_delete=models.PROTECT,
         verbose_name="Contact Information",
     )
     emergency_phone = models.ForeignKey(
         "EpaPhone",
-        on_delete=models.CASCADE,
+        on_delete=models.PROTECT,
         null=True,
         blank=True,
     )
@@ -155,43 +303,142 @@ class Handler(TrakBaseModel):
         return f"{self.epa_id}"
 
 
+class ManifestHandlerQuerySet(models.QuerySet):
+    """
+    Chainable queries for the ManifestHandler Model
+    """
+
+    def with_signed(self) -> models.QuerySet:
+        """
+        Annotate whether each manifest handler has an electronic signature, used by the
+        ManifestHandler.signed property in lieu of querying for each instance.
+        """
+        return self.annotate(
+            _has_esig=Exists(ESignature.objects.filter(manifest_handler=OuterRef("pk")))
+        )
+
+    def with_related(self) -> models.QuerySet:
+        """
+        Join the handler (and its addresses, contact, and phones) and paper signature,
+        and prefetch e-signatures, so serializing manifest handlers is not N+1.
+        """
+        return self.select_related(
+            "handler__site_address",
+            "handler__mail_address",
+            "handler__contact__phone",
+            "handler__emergency_phone",
+            "paper_signature",
+        ).prefetch_related(
+            Prefetch("e_signatures", queryset=ESignature.objects.select_related("signer__phone"))
+        )
+
+
 class ManifestHandlerManager(TrakBaseManager):
     """
     Inter-model related functionality for ManifestHandler Model
     """
 
-    def save(self, **handler_data) -> models.QuerySet:
+    def get_queryset(self) -> ManifestHandlerQuerySet:
+        return ManifestHandlerQuerySet(self.model, using=self._db)
+
+    def with_signed(self) -> ManifestHandlerQuerySet:
+        return self.get_queryset().with_signed()
+
+    def with_related(self) -> ManifestHandlerQuerySet:
+        return self.get_queryset().with_related()
+
+    def bulk_save(
+        self, manifest_handlers: List[Dict], handler_cache: Dict[str, Handler] = None
+    ) -> List["ManifestHandler"]:
+        """
+        Create a batch of manifest handlers, and their signatures, with one INSERT per table.
+        Not supported for multi-table inherited models (i.e., Transporter).
+
+        Args:
+            manifest_handlers (List[Dict]): manifest handler data dicts, as accepted by save()
+            handler_cache (Dict): optional Handler instances by EPA ID, updated in place
+        """
+        if handler_cache is None:
+            handler_cache = {}
+        handler_cache.update(
+            Handler.objects.get_or_create_bulk(
+                [
+                    data["handler"]
+                    for data in manifest_handlers
+                    if data["handler"]["epa_id"] not in handler_cache
+                ]
+            )
+        )
+        instances = []
+        e_signatures = []
+        for data in manifest_handlers:
+            data = dict(data)
+            e_signature_data = data.pop("e_signatures", [])
+            paper_signature = data.pop("paper_signature", None)
+            manifest_handler = self.model(
+                handler=handler_cache[data.pop("handler")["epa_id"]],
+                paper_signature=PaperSignature(**paper_signature) if paper_signature else None,
+                **data,
+            )
+            instances.append(manifest_handler)
+            e_signatures.extend(
+                {**e_sig_data, "manifest_handler": manifest_handler}
+                for e_sig_data in e_signature_data
+            )
+        PaperSignature.objects.bulk_create(
+            [instance.paper_signature for instance in instances if instance.paper_signature]
+        )
+        self.bulk_create(instances)
+        if e_signatures:
+            ESignature.objects.bulk_save(e_signatures)
+        return instances
+
+    def save(self, handler_cache: Dict[str, Handler] = None, **handler_data) -> models.QuerySet:
+        """
+        Create a manifest handler and its related fields
+
+        Keyword Args:
+            handler_cache (Dict): optional Handler instances by EPA ID, updated in place
+            handler (dict): Handler data dict, used if the handler is not found
+            e_signatures (list): optional list of ESignature data dicts
+            paper_signature (dict): optional PaperSignature data dict
+        """
         e_signatures = []
         paper_signature = None
         if "e_signatures" in handler_data:
             e_signatures = handler_data.pop("e_signatures")
-        logger.debug(f"e_signature data {e_signatures}")
+        logger.debug("e_signature data %s", e_signatures)
         if "paper_signature" in handler_data:
             paper_signature = PaperSignature.objects.create(**handler_data.pop("paper_signature"))
         try:
-            if Handler.objects.filter(epa_id=handler_data["handler"]["epa_id"]).exists():
-                handler = Handler.objects.get(epa_id=handler_data["handler"]["epa_id"])
+            if handler_cache is None:
+                handler_cache = {}
+            epa_id = handler_data["handler"]["epa_id"]
+            handler = Handler.objects.get_cached(epa_id, handler_cache)
+            if handler is not None:
                 handler_data.pop("handler")
-                logger.debug(f"using existing Handler {handler}")
+                logger.debug("using existing Handler %s", handler)
             else:
                 handler = Handler.objects.save(**handler_data.pop("handler"))
-                logger.debug(f"Handler created {handler}")
+                handler_cache[epa_id] = handler
+                logger.debug("Handler created %s", handler)
             manifest_handler = self.model.objects.create(
                 handler=handler,
                 paper_signature=paper_signature,
                 **handler_data,
             )
-            logger.debug(f"ManifestHandler created {manifest_handler}")
-            for e_signature_data in e_signatures:
-                e_sig = ESignature.objects.save(
-                    manifest_handler=manifest_handler, **e_signature_data
+            logger.debug("ManifestHandler created %s", manifest_handler)
+            if e_signatures:
+                e_sigs = ESignature.objects.bulk_save(
+                    e_signatures, manifest_handler=manifest_handler
                 )
-                logger.debug(f"ESignature created {e_sig}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("ESignatures created %s", [str(e_sig) for e_sig in e_sigs])
             return manifest_handler
         except KeyError as exc:
-            logger.warning(f"KeyError while creating Manifest handler {exc}")
+            logger.warning("KeyError while creating Manifest handler %s", exc)
         except ValidationError as exc:
-            logger.warning(f"ValidationError while creating Manifest handler {exc}")
+            logger.warning("ValidationError while creating Manifest handler %s", exc)
             raise exc
 
 
@@ -218,10 +465,19 @@ class ManifestHandler(TrakBaseModel):
 
     @property
     def signed(self) -> bool:
-        """Returns True if one of the signature types is present"""
-        e_signature_exists = ESignature.objects.filter(manifest_handler=self).exists()
-        paper_signature_exists = self.paper_signature is not None
-        return paper_signature_exists or e_signature_exists
+        """
+        Returns True if one of the signature types is present.
+        Uses the with_signed() annotation, or prefetched e-signatures, when available.
+        """
+        # check the FK column, self.paper_signature would query for the related row
+        if self.paper_signature_id is not None:
+            return True
+        e_signature_exists = getattr(self, "_has_esig", None)
+        if e_signature_exists is not None:
+            return e_signature_exists
+        if "e_signatures" in getattr(self, "_prefetched_objects_cache", {}):
+            return len(self.e_signatures.all()) > 0
+        return ESignature.objects.filter(manifest_handler=self).exists()
 
     def __str__(self):
         return f"ManifestHandler: {self.handler.epa_id}"
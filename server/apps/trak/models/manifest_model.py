@@ -43,7 +43,15 @@ class ManifestManager(TrakBaseManager):
     """
 
     def save(self, **manifest_data: Dict):
-        """Create a manifest with its related models instances"""
+        """
+        Create a manifest with its related models instances
+
+        Keyword Args:
+            handler_cache (Dict): Handler instances by EPA ID, already retrieved or created
+            generator (dict|ManifestHandler): generator data dict, or a saved ManifestHandler
+            tsd (dict|ManifestHandler): designated facility data dict, or a saved ManifestHandler
+        """
+        handler_cache = manifest_data.pop("handler_cache", None)
         waste_data = []
         trans_data = []
         additional_info = None
@@ -53,11 +61,19 @@ class ManifestManager(TrakBaseManager):
             waste_data = manifest_data.pop("wastes")
         if "transporters" in manifest_data:
             trans_data = manifest_data.pop("transporters")
-        # Create manifest handlers (generator and TSD) and all related models
+        # Create manifest handlers (generator and TSD) and all related models, unless saved
         if "generator" in manifest_data:
-            manifest_generator = ManifestHandler.objects.save(**manifest_data.pop("generator"))
+            manifest_generator = manifest_data.pop("generator")
+            if not isinstance(manifest_generator, ManifestHandler):
+                manifest_generator = ManifestHandler.objects.save(
+                    handler_cache=handler_cache, **manifest_generator
+                )
         if "tsd" in manifest_data:
-            manifest_tsd = ManifestHandler.objects.save(**manifest_data.pop("tsd"))
+            manifest_tsd = manifest_data.pop("tsd")
+            if not isinstance(manifest_tsd, ManifestHandler):
+                manifest_tsd = ManifestHandler.objects.save(
+                    handler_cache=handler_cache, **manifest_tsd
+                )
         if "additional_info" in manifest_data:
             additional_info = AdditionalInfo.objects.create(**manifest_data.pop("additional_info"))
         # Create model instances
@@ -69,10 +85,12 @@ class ManifestManager(TrakBaseManager):
         )
         for waste_line in waste_data:
             saved_waste_line = WasteLine.objects.save(manifest=manifest, **waste_line)
-            logger.debug(f"WasteLine saved {saved_waste_line.pk}")
+            logger.debug("WasteLine saved %s", saved_waste_line.pk)
         for transporter in trans_data:
-            saved_transporter = Transporter.objects.save(manifest=manifest, **transporter)
-            logger.debug(f"WasteLine saved {saved_transporter.pk}")
+            saved_transporter = Transporter.objects.save(
+                manifest=manifest, handler_cache=handler_cache, **transporter
+            )
+            logger.debug("Transporter saved %s", saved_transporter.pk)
         return manifest
 
 
@@ -1,4 +1,5 @@
 import logging
+from typing import Dict, List
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -91,6 +92,27 @@ class ESignatureManager(TrakBaseManager):
             e_signature_data["signer"] = Signer.objects.create(**e_signature_data.pop("signer"))
         return super().save(**e_signature_data)
 
+    def build(self, **e_signature_data) -> "ESignature":
+        """
+        Return an unsaved ESignature instance, with its unsaved Signer (if any) attached.
+        """
+        if "signer" in e_signature_data:
+            e_signature_data["signer"] = Signer(**e_signature_data.pop("signer"))
+        return self.model(**e_signature_data)
+
+    def bulk_save(self, e_signatures: List[Dict], **kwargs) -> List["ESignature"]:
+        """
+        Create a batch of ESignatures, and their related signers, with a single INSERT per table.
+
+        Keyword Args:
+            kwargs: fields shared by each ESignature in the batch (e.g., manifest_handler)
+        """
+        instances = [self.build(**e_sig_data, **kwargs) for e_sig_data in e_signatures]
+        signers = [e_sig.signer for e_sig in instances if e_sig.signer is not None]
+        if signers:
+            Signer.objects.bulk_create(signers, batch_size=1000)
+        return self.bulk_create(instances, batch_size=1000)
+
 
 class ESignature(TrakBaseModel):
     """EPA electronic signature"""
@@ -121,6 +121,8 @@ class ManifestHandlerSerializer(HandlerSerializer):
 
     def to_internal_value(self, data: Dict):
         instance = {}
+        # copy, so the input data can be validated again (e.g., after a failed batch)
+        data = dict(data)
         if "electronicSignaturesInfo" in data:
             instance["electronicSignaturesInfo"] = data.pop("electronicSignaturesInfo")
         if "paperSignatureInfo" in data:
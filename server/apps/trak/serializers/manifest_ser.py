@@ -1,9 +1,9 @@
 import logging
-from typing import Dict
+from typing import Dict, List
 
 from rest_framework import serializers
 
-from apps.trak.models import Manifest
+from apps.trak.models import Handler, Manifest, ManifestHandler
 from apps.trak.serializers.handler_ser import ManifestHandlerSerializer
 
 from ..models.manifest_model import AdditionalInfo
@@ -82,6 +82,54 @@ class MtnSerializer(TrakBaseSerializer):
         ]
 
 
+class ManifestListSerializer(serializers.ListSerializer):
+    """
+    Saves a batch of manifests, the handlers on every manifest in the batch are
+    retrieved, or created, at once instead of once per manifest. Likewise, the
+    generator and TSD manifest handlers are created together.
+    """
+
+    def create(self, validated_data: List[Dict]) -> List[Manifest]:
+        # Handlers by EPA ID, shared by the manifests (and their transporters) in the batch
+        handler_cache = Handler.objects.get_or_create_bulk(
+            [
+                handler_data
+                for manifest_data in validated_data
+                for handler_data in self._get_handlers_data(manifest_data)
+            ]
+        )
+        # generators and TSDs of the batch, in pairs, share one INSERT per table
+        manifest_handlers = ManifestHandler.objects.bulk_save(
+            [
+                manifest_handler_data
+                for manifest_data in validated_data
+                for manifest_handler_data in (manifest_data["generator"], manifest_data["tsd"])
+            ],
+            handler_cache=handler_cache,
+        )
+        return [
+            self.child.create(
+                {
+                    **manifest_data,
+                    "generator": manifest_handlers[2 * i],
+                    "tsd": manifest_handlers[2 * i + 1],
+                    "handler_cache": handler_cache,
+                }
+            )
+            for i, manifest_data in enumerate(validated_data)
+        ]
+
+    @staticmethod
+    def _get_handlers_data(manifest_data: Dict) -> List[Dict]:
+        """Return the handler data of the generator, TSD, and transporters on a manifest"""
+        manifest_handlers = [
+            manifest_data.get("generator"),
+            manifest_data.get("tsd"),
+            *manifest_data.get("transporters", []),
+        ]
+        return [mh["handler"] for mh in manifest_handlers if mh and "handler" in mh]
+
+
 class ManifestSerializer(TrakBaseSerializer):
     """
     Manifest model serializer for JSON marshalling/unmarshalling
@@ -235,6 +283,7 @@ class ManifestSerializer(TrakBaseSerializer):
 
     class Meta:
         model = Manifest
+        list_serializer_class = ManifestListSerializer
         fields = [
             "createdDate",
             "updatedDate",
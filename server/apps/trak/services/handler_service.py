@@ -44,9 +44,10 @@ class HandlerService:
         Retrieves a handler from the database or Pull it from RCRAInfo.
         This may be trying to do too much
         """
-        if Handler.objects.filter(epa_id=site_id).exists():
+        handler = Handler.objects.filter(epa_id=site_id).first()
+        if handler is not None:
             self.logger.debug(f"using existing handler {site_id}")
-            return Handler.objects.get(epa_id=site_id)
+            return handler
         new_handler = self.pull_rcra_handler(site_id=site_id)
         self.logger.debug(f"pulled new handler {new_handler}")
         return new_handler
@@ -70,9 +71,5 @@ class HandlerService:
 
     @transaction.atomic
     def _create_or_update_handler(self, *, handler_data: dict) -> Handler:
-        epa_id = handler_data.get("epa_id")
-        if Handler.objects.filter(epa_id=epa_id).exists():
-            handler = Handler.objects.get(epa_id=epa_id)
-            return handler
-        handler = Handler.objects.save(**handler_data)
-        return handler
+        # Handler.objects.save returns the existing handler if the EPA ID is already saved
+        return Handler.objects.save(**handler_data)
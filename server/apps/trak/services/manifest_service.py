@@ -1,9 +1,12 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from logging import Logger
 from typing import Dict, List
 
+import orjson
 from django.db import transaction
+from emanifest import RcrainfoResponse
 from requests import RequestException
 
 from apps.trak.models import Manifest
@@ -11,6 +14,19 @@ from apps.trak.serializers import ManifestSerializer
 
 from .rcrainfo_service import RcrainfoService
 
+# number of manifests retrieved from RCRAInfo concurrently, one per pooled connection
+MAX_PULL_WORKERS = RcrainfoService.pool_maxsize
+# date format expected by RCRAInfo's manifest search
+RCRA_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# default manifest search window (doesn't need be exact)
+DEFAULT_SEARCH_LOOKBACK = timedelta(days=360)
+
+
+def _decode(response: RcrainfoResponse):
+    """Decode the JSON body of an RCRAInfo response with orjson, see RcrainfoResponse.json()"""
+    # a multipart response's JSON part is set by RcrainfoResponse.decode(), if decoded
+    return orjson.loads(response._multipart_json or response.response.content)
+
 
 class ManifestService:
     """
@@ -31,23 +47,23 @@ class ManifestService:
     def _retrieve_manifest(self, mtn: str):
         response = self.rcrainfo.get_manifest(mtn)
         if response.ok:
-            self.logger.debug(f"manifest pulled {mtn}")
-            return response.json()
+            self.logger.debug("manifest pulled %s", mtn)
+            return _decode(response)
         else:
-            self.logger.warning(f"error retrieving manifest {mtn}")
-            raise RequestException(response.json())
+            self.logger.warning("error retrieving manifest %s", mtn)
+            raise RequestException(_decode(response))
 
     @transaction.atomic
-    def _save_manifest(self, manifest_json: dict) -> Manifest:
-        serializer = ManifestSerializer(data=manifest_json)
-        if serializer.is_valid():
-            self.logger.debug("manifest serializer is valid")
-            manifest = serializer.save()
-            self.logger.info(f"saved manifest {manifest.mtn}")
-            return manifest
-        else:
-            self.logger.warning(f"malformed serializer data: {serializer.errors}")
+    def _save_manifests(self, manifest_jsons: List[dict]) -> List[Manifest]:
+        serializer = ManifestSerializer(data=manifest_jsons, many=True)
+        if not serializer.is_valid():
+            self.logger.warning("malformed serializer data: %s", serializer.errors)
             raise Exception(serializer.errors)
+        self.logger.debug("manifest serializer is valid")
+        manifests = serializer.save()
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("saved manifests %s", [manifest.mtn for manifest in manifests])
+        return manifests
 
     def search_rcra_mtn(
         self,
@@ -65,47 +81,39 @@ class ManifestService:
 
         Keyword Args:
             site_id (str): EPA ID a site.
-            start_date (datetime): start of search window, defaults to 3 years ago.
+            start_date (datetime): start of search window, defaults to ~1 year ago.
             end_date (datetime): end of search window, defaults to now.
             status (str): manifest status in RCRAInfo.
             date_type (str): "CertifiedDate|ReceivedDate|ShippedDate|UpdatedDate"
             state_code (str): Two-letter code representing a state (e.g., "TX", "CA")
             site_type (str): "Generator|Tsdf|Transporter|RejectionInfo_AlternateTsdf"
         """
-        date_format = "%Y-%m-%dT%H:%M:%SZ"
-        if end_date:
-            end_date = end_date.replace(tzinfo=timezone.utc).strftime(date_format)
-        else:
-            end_date = datetime.utcnow().replace(tzinfo=timezone.utc).strftime(date_format)
-        if start_date:
-            start_date = start_date.replace(tzinfo=timezone.utc).strftime(date_format)
-        else:
-            # If no start date is specified, retrieve for ~last 3 years
-            # (doesn't need be exact, hope it's not leap year)
-            start_date = datetime.utcnow().replace(tzinfo=timezone.utc) - timedelta(
-                minutes=60 * 24 * 30 * 12
+        now = datetime.now(timezone.utc)
+        end_date = (end_date or now).strftime(RCRA_DATE_FORMAT)
+        start_date = (start_date or now - DEFAULT_SEARCH_LOOKBACK).strftime(RCRA_DATE_FORMAT)
+
+        # map our keyword arguments to fields expected by RCRAInfo, removing those that are None
+        filtered_params = {
+            k: v
+            for k, v in (
+                ("stateCode", state_code),
+                ("siteId", site_id),
+                ("status", status),
+                ("dateType", date_type),
+                ("siteType", site_type),
+                ("endDate", end_date),
+                ("startDate", start_date),
             )
-            start_date = start_date.strftime(date_format)
-
-        # map our keyword arguments to fields expected by RCRAInfo
-        search_params = {
-            "stateCode": state_code,
-            "siteId": site_id,
-            "status": status,
-            "dateType": date_type,
-            "siteType": site_type,
-            "endDate": end_date,
-            "startDate": start_date,
+            if v is not None
         }
-        # Remove arguments that are None
-        filtered_params = {k: v for k, v in search_params.items() if v is not None}
-        self.logger.debug(f"rcrainfo manifest search parameters {filtered_params}")
+        self.logger.debug("rcrainfo manifest search parameters %s", filtered_params)
 
         response = self.rcrainfo.search_mtn(**filtered_params)
-        self.logger.debug(f"rcrainfo manifest search response {response.json()}")
+        search_results = _decode(response)
+        self.logger.debug("rcrainfo manifest search response %s", search_results)
 
         if response.ok:
-            return response.json()
+            return search_results
         return []
 
     def pull_manifests(self, tracking_numbers: List[str]) -> Dict[str, List[str]]:
@@ -115,14 +123,44 @@ class ManifestService:
         Returns:
             results (Dict): with 2 members, 'success' and 'error' each is a list of MTN
             that corresponds to what manifest where successfully pulled or not.
+            Manifests already saved are not pulled again, they're included in 'success'.
         """
         results = {"success": [], "error": []}
-        for mtn in tracking_numbers:
-            try:
-                manifest_json: dict = self._retrieve_manifest(mtn)
-                manifest = self._save_manifest(manifest_json)
-                results["success"].append(manifest.mtn)
-            except Exception as exc:
-                self.logger.warning(f"error pulling manifest {mtn}: {exc}")
-                results["error"].append(mtn)
+        # manifests are created, not updated, and mtn is unique: don't retrieve saved ones again
+        existing = set(
+            Manifest.objects.filter(mtn__in=tracking_numbers).values_list("mtn", flat=True)
+        )
+        results["success"].extend(mtn for mtn in tracking_numbers if mtn in existing)
+        tracking_numbers = [mtn for mtn in tracking_numbers if mtn not in existing]
+        manifest_jsons: Dict[str, dict] = {}
+        if tracking_numbers and self.rcrainfo.auto_renew and not self.rcrainfo.is_authenticated:
+            # authenticate once up front, or each worker would request its own token
+            self.rcrainfo.authenticate()
+        # Retrieving is I/O bound, so we send the requests concurrently.
+        with ThreadPoolExecutor(max_workers=MAX_PULL_WORKERS) as executor:
+            futures = {
+                executor.submit(self._retrieve_manifest, mtn): mtn for mtn in tracking_numbers
+            }
+            for future in as_completed(futures):
+                mtn = futures[future]
+                try:
+                    manifest_jsons[mtn] = future.result()
+                except Exception as exc:
+                    self.logger.warning("error pulling manifest %s: %s", mtn, exc)
+                    results["error"].append(mtn)
+        if not manifest_jsons:
+            return results
+        try:
+            manifests = self._save_manifests(list(manifest_jsons.values()))
+            results["success"].extend(manifest.mtn for manifest in manifests)
+        except Exception as exc:
+            # fall back to saving one at a time, so one bad manifest doesn't fail the batch
+            self.logger.warning("error saving manifest batch: %s", exc)
+            for mtn, manifest_json in manifest_jsons.items():
+                try:
+                    manifest = self._save_manifests([manifest_json])[0]
+                    results["success"].append(manifest.mtn)
+                except Exception as exc:
+                    self.logger.warning("error pulling manifest %s: %s", mtn, exc)
+                    results["error"].append(mtn)
         return results
@@ -1,6 +1,7 @@
 import os
 
 from emanifest import RcrainfoClient
+from requests.adapters import HTTPAdapter
 
 from apps.trak.models import RcraProfile
 
@@ -11,6 +12,9 @@ class RcrainfoService(RcrainfoClient):
     web services.
     """
 
+    # max number of connections kept open to RCRAInfo, allows concurrent requests to reuse them
+    pool_maxsize = 16
+
     def __init__(self, *, api_username: str, rcrainfo_env: str = None, **kwargs):
         self.api_user = api_username
         if RcraProfile.objects.filter(user__username=self.api_user).exists():
@@ -21,6 +25,7 @@ class RcrainfoService(RcrainfoClient):
             rcrainfo_env = os.getenv("HT_RCRAINFO_ENV", "preprod")
             self.rcrainfo_env = rcrainfo_env
         super().__init__(rcrainfo_env, **kwargs)
+        self.mount("https://", HTTPAdapter(pool_maxsize=self.pool_maxsize))
 
     @property
     def has_api_user(self) -> bool:
@@ -1,4 +1,75 @@
-from apps.trak.models import Handler, ManifestHandler
+import pytest
+from django.db.models import ProtectedError
+
+from apps.trak.models import Address, Contact, Handler, ManifestHandler
+
+
+class TestHandlerManager:
+    """Test related to the Handler model manager"""
+
+    def test_get_or_create_bulk_creates_new_handlers(self, handler_serializer) -> None:
+        handler_serializer.is_valid()
+        handler_data = handler_serializer.validated_data
+        handlers = Handler.objects.get_or_create_bulk([handler_data, handler_data])
+        assert isinstance(handlers[handler_data["epa_id"]], Handler)
+        assert Handler.objects.filter(epa_id=handler_data["epa_id"]).count() == 1
+
+    def test_get_or_create_bulk_uses_existing(self, handler_factory, handler_serializer) -> None:
+        handler_serializer.is_valid()
+        existing = handler_factory(epa_id=handler_serializer.validated_data["epa_id"])
+        handlers = Handler.objects.get_or_create_bulk([handler_serializer.validated_data])
+        assert handlers[existing.epa_id].pk == existing.pk
+        assert handlers[existing.epa_id].get_deferred_fields() == set()
+
+    def test_get_cached_adds_handler_to_cache(self, handler_factory) -> None:
+        existing = handler_factory()
+        cache = {}
+        assert Handler.objects.get_cached(existing.epa_id, cache).pk == existing.pk
+        assert cache[existing.epa_id].pk == existing.pk
+
+    def test_get_cached_returns_none_when_missing(self, db) -> None:
+        cache = {}
+        assert Handler.objects.get_cached("foo_bar", cache) is None
+        assert cache == {}
+
+    def test_bulk_save_upserts_on_epa_id(self, handler_factory, handler_serializer) -> None:
+        """Handlers saved concurrently, after our lookup, are updated instead of raising"""
+        handler_serializer.is_valid()
+        existing = handler_factory(epa_id=handler_serializer.validated_data["epa_id"])
+        address_count, contact_count = Address.objects.count(), Contact.objects.count()
+        new_handler = Handler.objects._prepare(handler_serializer.validated_data)
+        saved = Handler.objects._bulk_save([new_handler])
+        assert saved[0].pk == existing.pk
+        existing.refresh_from_db()
+        assert existing.name == handler_serializer.validated_data["name"]
+        # the stored handler keeps its related rows, ours are not left behind
+        assert saved[0].site_address_id == existing.site_address_id
+        assert saved[0].contact == existing.contact
+        assert Address.objects.count() == address_count
+        assert Contact.objects.count() == contact_count
+
+    def test_identical_addresses_saved_once(self, handler_serializer) -> None:
+        handler_serializer.is_valid()
+        handler_data = handler_serializer.validated_data
+        assert handler_data["site_address"] == handler_data["mail_address"]
+        handler = Handler.objects.get_or_create_bulk([handler_data])[handler_data["epa_id"]]
+        assert handler.site_address_id == handler.mail_address_id
+        assert Address.objects.count() == 1
+
+    def test_shared_related_rows_are_protected(self, handler_serializer) -> None:
+        """Deleting a row shared by handlers of a batch does not cascade to those handlers"""
+        handler_serializer.is_valid()
+        handler_data = handler_serializer.validated_data
+        other_data = {**handler_data, "epa_id": "other_epa_id"}
+        handlers = Handler.objects.get_or_create_bulk([handler_data, other_data])
+        handler, other = handlers[handler_data["epa_id"]], handlers["other_epa_id"]
+        assert handler.site_address_id == other.site_address_id
+        assert handler.contact_id == other.contact_id
+        with pytest.raises(ProtectedError):
+            Address.objects.filter(pk=handler.site_address_id).delete()
+        with pytest.raises(ProtectedError):
+            Contact.objects.filter(pk=handler.contact_id).delete()
+        assert Handler.objects.filter(pk__in=[handler.pk, other.pk]).count() == 2
 
 
 class TestManifestHandlerModel:
@@ -38,3 +109,48 @@ class TestManifestHandlerModel:
         )
         manifest_handler.save()
         assert manifest_handler.signed is False
+
+    def test_manager_uses_existing_handler(self, handler_factory, handler_serializer) -> None:
+        handler_serializer.is_valid()
+        existing = handler_factory(epa_id=handler_serializer.validated_data["epa_id"])
+        manifest_handler = ManifestHandler.objects.save(handler=handler_serializer.validated_data)
+        assert manifest_handler.handler.pk == existing.pk
+        assert Handler.objects.filter(epa_id=existing.epa_id).count() == 1
+
+    def test_signed_uses_annotation(
+        self, handler_factory, e_signature_factory, django_assert_num_queries
+    ):
+        # no paper signature, so signed has to read the e-signature annotation
+        manifest_handler = ManifestHandler.objects.create(handler=handler_factory())
+        e_signature_factory(manifest_handler=manifest_handler)
+        annotated = ManifestHandler.objects.with_signed().get(pk=manifest_handler.pk)
+        with django_assert_num_queries(0):
+            assert annotated.signed is True
+
+    def test_with_related_joins_handler(self, manifest_handler_factory, django_assert_num_queries):
+        manifest_handler = manifest_handler_factory()
+        with django_assert_num_queries(2):
+            related = ManifestHandler.objects.with_related().get(pk=manifest_handler.pk)
+            assert related.handler.site_address.address1 == "Main st."
+            assert related.handler.contact.phone is not None
+            assert list(related.e_signatures.all()) == []
+
+    def test_signed_uses_prefetched_e_signatures(
+        self, handler_factory, e_signature_factory, django_assert_num_queries
+    ):
+        manifest_handler = ManifestHandler.objects.create(handler=handler_factory())
+        e_signature_factory(manifest_handler=manifest_handler)
+        prefetched = ManifestHandler.objects.prefetch_related("e_signatures").get(
+            pk=manifest_handler.pk
+        )
+        with django_assert_num_queries(0):
+            assert prefetched.signed is True
+
+    def test_bulk_save_creates_manifest_handlers(self, handler_serializer) -> None:
+        handler_serializer.is_valid()
+        manifest_handlers = ManifestHandler.objects.bulk_save(
+            [{"handler": handler_serializer.validated_data}] * 2
+        )
+        assert len(manifest_handlers) == 2
+        assert manifest_handlers[0].pk != manifest_handlers[1].pk
+        assert manifest_handlers[0].handler_id == manifest_handlers[1].handler_id
@@ -1,7 +1,7 @@
 import pytest
 from django.db import IntegrityError
 
-from apps.trak.models import PaperSignature
+from apps.trak.models import ESignature, PaperSignature, Signer
 
 
 class TestPaperSignatureModel:
@@ -17,3 +17,18 @@ class TestPaperSignatureModel:
     def test_printed_name_is_required(self, paper_signature_factory):
         with pytest.raises(IntegrityError):
             paper_signature_factory(printed_name=None)
+
+
+class TestESignatureModel:
+    """Test related to the ESignature model and its API"""
+
+    def test_bulk_save_creates_signatures_and_signers(self, manifest_handler_factory):
+        manifest_handler = manifest_handler_factory()
+        e_signatures = [
+            {"signer": {"first_name": "David", "last_name": "Graham"}, "on_behalf": False},
+            {"cromerr_activity_id": "foo", "on_behalf": True},
+        ]
+        saved = ESignature.objects.bulk_save(e_signatures, manifest_handler=manifest_handler)
+        assert len(saved) == 2
+        assert ESignature.objects.filter(manifest_handler=manifest_handler).count() == 2
+        assert Signer.objects.filter(first_name="David").exists()
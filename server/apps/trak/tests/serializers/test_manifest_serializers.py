@@ -31,3 +31,10 @@ class TestManifestSerializer:
         manifest = manifest_10003114elc_serializer.save()
         additional_info = manifest.additional_info
         assert isinstance(additional_info, AdditionalInfo)
+
+    def test_saves_many(self, db, haztrak_json):
+        serializer = ManifestSerializer(data=[haztrak_json.MANIFEST.value], many=True)
+        serializer.is_valid()
+        manifests = serializer.save()
+        assert isinstance(manifests[0], Manifest)
+        assert Manifest.objects.filter(mtn=manifests[0].mtn).exists()
@@ -1,4 +1,8 @@
+import re
+from http import HTTPStatus
+
 import pytest
+import responses
 
 from apps.trak.services import ManifestService, RcrainfoService
 
@@ -18,6 +22,53 @@ class TestManifestService:
         results = manifest_service.pull_manifests(tracking_numbers=[self.tracking_number])
         assert self.tracking_number in results["success"]
 
+    def test_pull_manifests_reports_errors(self, manifest_100033134elc_rcra_response):
+        """Test manifests that fail to be retrieved do not prevent others from being saved"""
+        rcrainfo = RcrainfoService(api_username=self.user.username, auto_renew=False)
+        manifest_service = ManifestService(username=self.user.username, rcrainfo=rcrainfo)
+        bad_mtn = "999999999ELC"
+        manifest_100033134elc_rcra_response.get(
+            url=f"{rcrainfo.base_url}/api/v1/emanifest/manifest/{bad_mtn}",
+            json={"message": "not found"},
+            status=HTTPStatus.NOT_FOUND,
+        )
+        results = manifest_service.pull_manifests(tracking_numbers=[self.tracking_number, bad_mtn])
+        assert self.tracking_number in results["success"]
+        assert bad_mtn in results["error"]
+
+    def test_pull_manifests_authenticates_once(self, manifest_100033134elc_rcra_response):
+        """Test workers retrieving manifests concurrently share one session token"""
+        rcrainfo = RcrainfoService(api_username=self.user.username)
+        manifest_service = ManifestService(username=self.user.username, rcrainfo=rcrainfo)
+        bad_mtn = "999999999ELC"
+        manifest_100033134elc_rcra_response.get(
+            url=f"{rcrainfo.base_url}/api/v1/emanifest/manifest/{bad_mtn}",
+            json={"message": "not found"},
+            status=HTTPStatus.NOT_FOUND,
+        )
+        auth = manifest_100033134elc_rcra_response.get(
+            url=re.compile(f"{rcrainfo.base_url}/api/v1/auth/.*"),
+            json={"token": "mock_token", "expiration": "2099-01-01T00:00:00.000+00:00"},
+            status=HTTPStatus.OK,
+        )
+        manifest_service.pull_manifests(tracking_numbers=[self.tracking_number, bad_mtn])
+        assert auth.call_count == 1
+
+    def test_pull_manifests_skips_saved_manifests(
+        self, manifest_factory, manifest_handler_factory
+    ):
+        """Test manifests already saved are not retrieved from RCRAInfo again"""
+        # the site's handler already exists, use it as the generator
+        generator = manifest_handler_factory(handler=self.gen001.epa_site)
+        manifest_factory(mtn=self.tracking_number, generator=generator)
+        rcrainfo = RcrainfoService(api_username=self.user.username, auto_renew=False)
+        manifest_service = ManifestService(username=self.user.username, rcrainfo=rcrainfo)
+        with responses.RequestsMock():
+            # no mocked endpoints, any request to RCRAInfo would raise a ConnectionError
+            results = manifest_service.pull_manifests(tracking_numbers=[self.tracking_number])
+        assert self.tracking_number in results["success"]
+        assert results["error"] == []
+
     def test_search_rcra_mtn(self, search_site_mtn_rcra_response):
         """Test retrieves a manifest from RCRAInfo"""
         rcrainfo = RcrainfoService(api_username=self.user.username, auto_renew=False)
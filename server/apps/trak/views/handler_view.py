@@ -46,7 +46,7 @@ class TransporterView(RetrieveAPIView):
     Returns details on a Transporter
     """
 
-    queryset = Transporter.objects.all()
+    queryset = Transporter.objects.with_signed().with_related()
     serializer_class = TransporterSerializer
     permission_classes = [permissions.AllowAny]
 
@@ -58,6 +58,6 @@ class ManifestHandlerView(RetrieveAPIView):
     This is not included in the current URL configs, but kept here for documentation.
     """
 
-    queryset = ManifestHandler.objects.all()
+    queryset = ManifestHandler.objects.with_signed().with_related()
     serializer_class = ManifestHandlerSerializer
     permission_classes = [permissions.AllowAny]
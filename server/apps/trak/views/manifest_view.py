@@ -1,14 +1,14 @@
 import logging
 from http import HTTPStatus
 
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from drf_spectacular.utils import extend_schema
 from rest_framework import permissions, viewsets
 from rest_framework.generics import GenericAPIView, ListAPIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from apps.trak.models import Manifest, Site
+from apps.trak.models import Manifest, ManifestHandler, Site, Transporter
 from apps.trak.serializers import ManifestSerializer, MtnSerializer
 from apps.trak.tasks import pull_manifest
 
@@ -23,7 +23,11 @@ class ManifestView(viewsets.ModelViewSet):
     The Uniform hazardous waste manifest by the manifest tracking number (MTN)
     """
 
-    queryset = Manifest.objects.all()
+    queryset = Manifest.objects.prefetch_related(
+        Prefetch("generator", queryset=ManifestHandler.objects.with_signed().with_related()),
+        Prefetch("tsd", queryset=ManifestHandler.objects.with_signed().with_related()),
+        Prefetch("transporters", queryset=Transporter.objects.with_signed().with_related()),
+    )
     lookup_field = "mtn"
     serializer_class = ManifestSerializer
     permission_classes = [permissions.AllowAny]  # uncomment for debugging via (browsable API)